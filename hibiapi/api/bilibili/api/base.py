@@ -1,16 +1,20 @@
 import hashlib
-import json
+import re
 from enum import Enum, IntEnum
 from time import time
-from typing import Any, Dict, Optional, overload
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, overload
 
 from httpx import URL
 
 from hibiapi.api.bilibili.constants import BilibiliConstants
+from hibiapi.utils import json_loads
 from hibiapi.utils.decorators import enum_auto_doc
 from hibiapi.utils.net import catch_network_error
 from hibiapi.utils.routing import BaseEndpoint, dont_route
 
+JSONP_PATTERN = re.compile(rb"^[^(]*\((.*)\)[^)]*$", re.DOTALL)
+
 
 @enum_auto_doc
 class TimelineType(str, Enum):
@@ -135,28 +139,34 @@ class RankDurationType(IntEnum):
 
 
 class BaseBilibiliEndpoint(BaseEndpoint):
-    def _sign(self, base: str, endpoint: str, params: Dict[str, Any]) -> URL:
-        params.update(
-            {
-                **BilibiliConstants.DEFAULT_PARAMS,
-                "access_key": BilibiliConstants.ACCESS_KEY,
-                "appkey": BilibiliConstants.APP_KEY,
-                "ts": int(time()),
-            }
-        )
-        params = {k: params[k] for k in sorted(params.keys())}
-        url = self._join(base=base, endpoint=endpoint, params=params)
-        params["sign"] = hashlib.md5(url.query + BilibiliConstants.SECRET).hexdigest()
-        return URL(url, params=params)
+    _SIGN_PARAMS: Tuple[Tuple[str, Any], ...] = tuple(
+        {
+            **BilibiliConstants.DEFAULT_PARAMS,
+            "access_key": BilibiliConstants.ACCESS_KEY,
+            "appkey": BilibiliConstants.APP_KEY,
+        }.items()
+    )
+    _TYPE_DYNAMIC_PARAMS: Mapping[str, Any] = MappingProxyType({"type": "json"})
+
+    def _sign(self, base: str, endpoint: str, params: Mapping[str, Any]) -> URL:
+        merged: Dict[str, Any] = {**params}
+        merged.update(self._SIGN_PARAMS)
+        merged["ts"] = int(time())
+        signed = dict(sorted(merged.items()))
+        url = self._join(base=base, endpoint=endpoint, params=signed)
+        sign = hashlib.md5(url.query)
+        sign.update(BilibiliConstants.SECRET)
+        return url.copy_with(query=url.query + b"&sign=" + sign.hexdigest().encode())
 
     @staticmethod
-    def _parse_json(content: str) -> Dict[str, Any]:
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            # NOTE: this is used to parse jsonp response
-            right, left = content.find("("), content.rfind(")")
-            return json.loads(content[right + 1 : left].strip())
+    def _parse_json(content: bytes) -> Dict[str, Any]:
+        content = content.lstrip()
+        if content[:1] in (b"{", b"["):
+            return json_loads(content)
+        # NOTE: this is used to parse jsonp response
+        if matched := JSONP_PATTERN.match(content):
+            return json_loads(matched.group(1))
+        return json_loads(content)
 
     @overload
     async def request(
@@ -164,7 +174,7 @@ class BaseBilibiliEndpoint(BaseEndpoint):
         endpoint: str,
         *,
         sign: bool = True,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
     ) -> Dict[str, Any]:
         ...
 
@@ -175,7 +185,7 @@ class BaseBilibiliEndpoint(BaseEndpoint):
         source: str,
         *,
         sign: bool = True,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
     ) -> Dict[str, Any]:
         ...
 
@@ -187,7 +197,7 @@ class BaseBilibiliEndpoint(BaseEndpoint):
         source: Optional[str] = None,
         *,
         sign: bool = True,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
     ) -> Dict[str, Any]:
         host = BilibiliConstants.SERVER_HOST[source or "app"]
         url = (self._sign if sign else self._join)(
@@ -195,7 +205,7 @@ class BaseBilibiliEndpoint(BaseEndpoint):
         )
         response = await self.client.get(url)
         response.raise_for_status()
-        return self._parse_json(response.text)
+        return self._parse_json(response.content)
 
     async def playurl(
         self,
@@ -403,9 +413,7 @@ class BaseBilibiliEndpoint(BaseEndpoint):
             "typedynamic/index",
             "api",
             sign=False,
-            params={
-                "type": "json",
-            },
+            params=self._TYPE_DYNAMIC_PARAMS,
         )
 
     async def timeline(self, *, type: TimelineType = TimelineType.GLOBAL):
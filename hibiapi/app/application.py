@@ -1,18 +1,25 @@
 import asyncio
+from functools import lru_cache
+from hashlib import sha256
 from ipaddress import ip_address
+from math import ceil
 from secrets import compare_digest
-from typing import List
+from time import time
+from typing import Dict, List
 from urllib.parse import ParseResult
 
 import sentry_sdk
 from fastapi import Depends, FastAPI, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from sentry_sdk.integrations.logging import LoggingIntegration
+from starlette.convertors import Convertor, register_url_convertor
 
 from hibiapi import __version__
 from hibiapi.app.routes import router as ImplRouter
+from hibiapi.utils import HAS_ORJSON
 from hibiapi.utils.cache import cache
 from hibiapi.utils.config import Config
 from hibiapi.utils.exceptions import ClientSideException, RateLimitReachedException
@@ -54,19 +61,36 @@ class AuthorizationModel(BaseModel):
 AUTHORIZATION_ENABLED = Config["authorization"]["enabled"].as_bool()
 AUTHORIZATION_ALLOWED = Config["authorization"]["allowed"].get(List[AuthorizationModel])
 
+
+def _authorization_table(
+    allowed: List[AuthorizationModel],
+) -> Dict[bytes, List[bytes]]:
+    # NOTE: a username may be listed more than once, any of its passwords is valid
+    table: Dict[bytes, List[bytes]] = {}
+    for user in allowed:
+        digest = sha256(user.username.encode()).digest()
+        table.setdefault(digest, []).append(sha256(user.password.encode()).digest())
+    return table
+
+
+AUTHORIZATION_DUMMY = sha256(b"").digest()
+AUTHORIZATION_TABLE = _authorization_table(AUTHORIZATION_ALLOWED)
+
 security = HTTPBasic()
 
 
 async def basic_authorization_depend(
     credentials: HTTPBasicCredentials = Depends(security),
 ):
-    # NOTE: We use `compare_digest` to avoid timing attacks.
+    # NOTE: We use `compare_digest` to avoid timing attacks, passwords are compared
+    # by their equal-length digests and unknown users against a dummy digest.
     # Ref: https://fastapi.tiangolo.com/advanced/security/http-basic-auth/
-    for allowed in AUTHORIZATION_ALLOWED:
-        if compare_digest(credentials.username, allowed.username) and compare_digest(
-            credentials.password, allowed.password
-        ):
-            return credentials.username, credentials.password
+    password = sha256(credentials.password.encode()).digest()
+    candidates = AUTHORIZATION_TABLE.get(sha256(credentials.username.encode()).digest())
+    if candidates is None:
+        compare_digest(password, AUTHORIZATION_DUMMY)
+    elif any([compare_digest(password, expected) for expected in candidates]):
+        return credentials.username, credentials.password
     raise ClientSideException(
         f"Invalid credentials for user {credentials.username!r}",
         status_code=401,
@@ -79,23 +103,33 @@ RATE_LIMIT_MAX = Config["limit"]["max"].as_number()
 RATE_LIMIT_INTERVAL = Config["limit"]["interval"].as_number()
 
 
+@lru_cache(maxsize=4096)
+def _limit_key_for(host: str) -> str:
+    try:
+        client_ip = ip_address(host)
+    except ValueError:
+        return f"rate_limit:fallback-{host}"
+    return f"rate_limit:IPv{client_ip.version}-{client_ip.packed.hex()}"
+
+
 async def rate_limit_depend(request: Request):
     if not request.client:
         return
 
-    try:
-        client_ip = ip_address(request.client.host)
-        client_ip_hex = client_ip.packed.hex()
-        limit_key = f"rate_limit:IPv{client_ip.version}-{client_ip_hex:x}"
-    except ValueError:
-        limit_key = f"rate_limit:fallback-{request.client.host}"
+    limit_key = _limit_key_for(request.client.host)
+
+    # NOTE: Windows are aligned to the clock and reset for every client at the
+    # same moment, so the remaining time is known locally and a lost `expire`
+    # can never keep a client locked out.
+    window, elapsed = divmod(time(), RATE_LIMIT_INTERVAL)
+    limit_key = f"{limit_key}:{window:.0f}"
 
     request_count: int = await cache.incr(limit_key)  # type:ignore
     if request_count <= 1:
         await cache.expire(limit_key, timeout=RATE_LIMIT_INTERVAL)
     elif request_count > RATE_LIMIT_MAX:
-        limit_remain: int = await cache.get_expire(limit_key)
-        raise RateLimitReachedException(headers={"Retry-After": limit_remain})
+        limit_remain = ceil(RATE_LIMIT_INTERVAL - elapsed)
+        raise RateLimitReachedException(headers={"Retry-After": f"{limit_remain}"})
 
     return
 
@@ -106,6 +140,7 @@ app = FastAPI(
     description=DESCRIPTION,
     docs_url="/docs/test",
     redoc_url="/docs",
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
 )
 app.include_router(
     ImplRouter,
@@ -123,10 +158,12 @@ async def redirect():
     return Response(status_code=302, headers={"Location": "/docs"})
 
 
+ROBOTS_CONTENT = Config["content"]["robots"].as_str().strip().encode()
+
+
 @app.get("/robots.txt", include_in_schema=False)
 async def robots():
-    content = Config["content"]["robots"].as_str().strip()
-    return Response(content, status_code=200)
+    return Response(ROBOTS_CONTENT, status_code=200, media_type="text/plain")
 
 
 @app.on_event("shutdown")
@@ -145,7 +182,7 @@ async def cleanup_clients():
     ]
     if opened_clients:
         await asyncio.gather(
-            *map(lambda client: client.aclose(), opened_clients),
+            *(client.aclose() for client in opened_clients),
             return_exceptions=True,
         )
     logger.debug(f"Cleaned <r>{len(opened_clients)}</r> unclosed HTTP clients")
@@ -172,21 +209,27 @@ def _redirect(request: Request, path: str, to: str) -> Response:
     )
 
 
-@app.get("/qrcode/{path:path}", include_in_schema=False)
-async def _qr_redirect(path: str, request: Request):
-    return _redirect(request, path, "/api/qrcode/")
+_REDIRECT_TARGETS = {
+    "qrcode": "/api/qrcode/",
+    "pixiv": "/api/pixiv/",
+    "netease": "/api/netease/",
+    "bilibili": "/api/bilibili/v2/",
+}
+
+
+class _RedirectSourceConvertor(Convertor):
+    regex = "|".join(_REDIRECT_TARGETS)
 
+    def convert(self, value: str) -> str:
+        return value
 
-@app.get("/pixiv/{path:path}", include_in_schema=False)
-async def _pixiv_redirect(path: str, request: Request):
-    return _redirect(request, path, "/api/pixiv/")
+    def to_string(self, value: str) -> str:
+        return value
 
 
-@app.get("/netease/{path:path}", include_in_schema=False)
-async def _netease_redirect(path: str, request: Request):
-    return _redirect(request, path, "/api/netease/")
+register_url_convertor("hibiapi_legacy_redirect", _RedirectSourceConvertor())
 
 
-@app.get("/bilibili/{path:path}", include_in_schema=False)
-async def _bilibili_redirect(path: str, request: Request):
-    return _redirect(request, path, "/api/bilibili/v2/")
+@app.get("/{source:hibiapi_legacy_redirect}/{path:path}", include_in_schema=False)
+async def _legacy_redirect(source: str, path: str, request: Request):
+    return _redirect(request, path, _REDIRECT_TARGETS[source])
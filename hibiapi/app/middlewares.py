@@ -1,4 +1,4 @@
-from datetime import datetime
+from time import perf_counter_ns
 from typing import Awaitable, Callable, List
 
 from fastapi import Request, Response
@@ -40,10 +40,10 @@ HttpxIntegration.setup_once()
 
 @app.middleware("http")
 async def request_logger(request: Request, call_next: RequestHandler) -> Response:
-    start_time = datetime.now()
+    start_time = perf_counter_ns()
     host, port = request.client or (None, None)
     response = await call_next(request)
-    process_time = (datetime.now() - start_time).total_seconds() * 1000
+    process_time = (perf_counter_ns() - start_time) / 1e6
     response_headers.get().setdefault("X-Process-Time", f"{process_time:.3f}")
     bg, fg = (
         ("green", "red")
@@ -8,7 +8,7 @@ from hibiapi.utils.routing import SlashRouter
 from hibiapi.utils.temp import TempFile
 
 QR_CALLBACK_TEMPLATE = (
-    r"""function {fun}(){document.write('<img class="qrcode" src="{url}"/>');}"""
+    r"""function {fun}(){{document.write('<img class="qrcode" src="{url}"/>');}}"""
 )
 
 __mount__, __config__ = "qrcode", Config
@@ -41,28 +41,19 @@ async def qrcode_api(
         text, size=size, logo=logo, level=level, bgcolor=bgcolor, fgcolor=fgcolor
     )
     qr.url = TempFile.to_url(request, qr.path)  # type:ignore
-    """function {fun}(){document.write('<img class="qrcode" src="{url}"/>');}"""
-    return (
-        qr
-        if encode == ReturnEncode.json
-        else Response(
+
+    if encode == ReturnEncode.json:
+        return qr
+    elif encode == ReturnEncode.raw:
+        return Response(
             content=qr.json(),
             media_type="application/json",
             headers={"Location": qr.url},
             status_code=302,
         )
-        if encode == ReturnEncode.raw
-        else Response(
-            content="{fun}({json})".format(json=qr.json(), fun=fun),
-            media_type="text/javascript",
-        )
-        if encode == ReturnEncode.jsc
-        else Response(
-            content="function "
-            + fun
-            + '''(){document.write('<img class="qrcode" src="'''
-            + qr.url
-            + """"/>');}""",
-            media_type="text/javascript",
-        )
+    elif encode == ReturnEncode.jsc:
+        return Response(content=f"{fun}({qr.json()})", media_type="text/javascript")
+    return Response(
+        content=QR_CALLBACK_TEMPLATE.format(fun=fun, url=qr.url),
+        media_type="text/javascript",
     )
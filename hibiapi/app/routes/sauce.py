@@ -13,7 +13,7 @@ from hibiapi.api.sauce import (
 )
 from hibiapi.utils.routing import SlashRouter
 
-if (not SauceConstants.API_KEY) or (not all(map(str.strip, SauceConstants.API_KEY))):
+if not (SauceConstants.API_KEY and all(key.strip() for key in SauceConstants.API_KEY)):
     logger.warning("Sauce API key not set, SauceNAO endpoint will be unavailable")
     SauceConstants.CONFIG["enabled"].set(False)
 
@@ -24,8 +24,12 @@ SauceAPIRoot = NetRequest()
 
 
 async def request_client():
-    async with SauceAPIRoot as client:
-        yield SauceEndpoint(client)
+    # NOTE: the client is shared for the whole app lifetime and closed by
+    # `cleanup_clients` on shutdown, so there is nothing to release per request
+    client = SauceAPIRoot.client
+    if client is None or client.is_closed:
+        client = SauceAPIRoot.create_client()
+    return SauceEndpoint(client)
 
 
 @router.get("/")
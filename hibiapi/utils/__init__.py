@@ -0,0 +1,10 @@
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+__all__ = ["HAS_ORJSON", "json_loads"]
@@ -130,11 +130,11 @@ def Retry(
 def ToAsync(
     function: Callable[Argument_T, Return_T]
 ) -> Callable[Argument_T, Awaitable[Return_T]]:
-    @TimeIt
     @wraps(function)
     async def wrapper(*args: Argument_T.args, **kwargs: Argument_T.kwargs) -> Return_T:
-        return await asyncio.get_running_loop().run_in_executor(
-            None, lambda: function(*args, **kwargs)
-        )
+        loop = asyncio.get_running_loop()
+        if kwargs:
+            return await loop.run_in_executor(None, partial(function, *args, **kwargs))
+        return await loop.run_in_executor(None, function, *args)
 
     return wrapper
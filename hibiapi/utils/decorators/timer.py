@@ -6,7 +6,7 @@ from functools import wraps
 from inspect import iscoroutinefunction
 from typing import Any, Callable, ClassVar, Dict, Optional, TypeVar
 
-from hibiapi.utils.log import logger
+from hibiapi.utils.log import TRACE_ENABLED, logger
 
 Callable_T = TypeVar("Callable_T", bound=Callable)
 
@@ -23,7 +23,7 @@ class Timer:
     name: Optional[str] = None
     text: str = "Elapsed time: {:0.3f} seconds"
     logger_func: Optional[Callable[[str], None]] = print
-    _start_time: Optional[float] = field(default=None, init=False, repr=False)
+    _start_time: Optional[int] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialization: add timer to dict of timers"""
@@ -35,7 +35,7 @@ class Timer:
         if self._start_time is not None:
             raise TimerError("Timer is running. Use .stop() to stop it")
 
-        self._start_time = time.perf_counter()
+        self._start_time = time.perf_counter_ns()
 
     def stop(self) -> float:
         """Stop the timer, and report the elapsed time"""
@@ -43,7 +43,7 @@ class Timer:
             raise TimerError("Timer is not running. Use .start() to start it")
 
         # Calculate elapsed time
-        elapsed_time = time.perf_counter() - self._start_time
+        elapsed_time = (time.perf_counter_ns() - self._start_time) / 1e9
         self._start_time = None
 
         # Report elapsed time
@@ -63,28 +63,30 @@ class Timer:
         """Stop the context manager timer"""
         self.stop()
 
-    def _recreate_cm(self) -> Timer:
-        return self.__class__(self.name, self.text, self.logger_func)
+    def _recreate_cm(self, text: Optional[str] = None) -> Timer:
+        return self.__class__(self.name, text or self.text, self.logger_func)
 
     def __call__(self, function: Callable_T) -> Callable_T:
+        if not (self.logger_func or self.name):
+            return function  # nothing would be reported, skip the extra frame
+
+        async_text = (
+            f"<g>Async</g> function <y>{function.__qualname__}</y> "
+            "cost <e>{:.3f}ms</e>"
+        )
+        sync_text = (
+            f"<g>sync</g> function <y>{function.__qualname__}</y> "
+            "cost <e>{:.3f}ms</e>"
+        )
+
         @wraps(function)
         async def async_wrapper(*args: Any, **kwargs: Any):
-            self.text = (
-                f"<g>Async</g> function <y>{function.__qualname__}</y> "
-                "cost <e>{:.3f}ms</e>"
-            )
-
-            with self._recreate_cm():
+            with self._recreate_cm(async_text):
                 return await function(*args, **kwargs)
 
         @wraps(function)
         def sync_wrapper(*args: Any, **kwargs: Any):
-            self.text = (
-                f"<g>sync</g> function <y>{function.__qualname__}</y> "
-                "cost <e>{:.3f}ms</e>"
-            )
-
-            with self._recreate_cm():
+            with self._recreate_cm(sync_text):
                 return function(*args, **kwargs)
 
         return (
@@ -92,4 +94,4 @@ class Timer:
         )  # type:ignore
 
 
-TimeIt = Timer(logger_func=logger.trace)
+TimeIt = Timer(logger_func=logger.trace if TRACE_ENABLED else None)
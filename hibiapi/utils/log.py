@@ -66,3 +66,5 @@ if LOG_FILE is not None:
     )
 
 logger.level(LOG_LEVEL)
+
+TRACE_ENABLED = logger.level(LOG_LEVEL).no <= logger.level("TRACE").no
@@ -6,12 +6,12 @@ from typing import (
     ClassVar,
     Coroutine,
     Dict,
-    List,
     Optional,
     Type,
     TypeVar,
     Union,
 )
+from weakref import WeakSet
 
 from httpx import (
     URL,
@@ -65,7 +65,7 @@ class AsyncHTTPClient(AsyncClient):
 
 class BaseNetClient:
     connections: ClassVar[int] = 0
-    clients: ClassVar[List[AsyncHTTPClient]] = []
+    clients: ClassVar["WeakSet[AsyncHTTPClient]"] = WeakSet()
 
     client: Optional[AsyncHTTPClient] = None
 
@@ -91,7 +91,7 @@ class BaseNetClient:
             follow_redirects=True,
         )
         self.client.net_client = self
-        BaseNetClient.clients.append(self.client)
+        BaseNetClient.clients.add(self.client)
         return self.client
 
     async def __aenter__(self):
@@ -2,7 +2,7 @@ import inspect
 from contextvars import ContextVar
 from enum import Enum
 from fnmatch import fnmatch
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Tuple, Type
 from urllib.parse import ParseResult, urlparse
 
@@ -62,24 +62,29 @@ class BaseEndpoint(metaclass=EndpointMeta, cache_endpoints=False):
         self.client = client
 
     @staticmethod
-    def _join(base: str, endpoint: str, params: Dict[str, Any]) -> URL:
+    @lru_cache(maxsize=64)
+    def _host(base: str) -> str:
         host: ParseResult = urlparse(base)
+        return ParseResult(
+            scheme=host.scheme,
+            netloc=host.netloc,
+            path="",
+            params="",
+            query="",
+            fragment="",
+        ).geturl()
+
+    @classmethod
+    def _join(cls, base: str, endpoint: str, params: Mapping[str, Any]) -> URL:
         params = {
             k: (v.value if isinstance(v, Enum) else v)
             for k, v in params.items()
             if v is not None
         }
-        return URL(
-            url=ParseResult(
-                scheme=host.scheme,
-                netloc=host.netloc,
-                path=endpoint.format(**params),
-                params="",
-                query="",
-                fragment="",
-            ).geturl(),
-            params=params,
-        )
+        path = endpoint.format(**params)
+        if path and not path.startswith("/"):
+            path = f"/{path}"
+        return URL(url=cls._host(base) + path, params=params)
 
 
 class SlashRouter(APIRouter):
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import pytest
 from fastapi import Depends
@@ -56,6 +56,122 @@ def test_notfound(client: TestClient):
     assert ExceptionReturn.parse_obj(response.json())
 
 
+def test_robots(client: TestClient):
+    response = client.get("/robots.txt")
+    assert response.status_code == 200
+    assert "text/plain" in response.headers["content-type"]
+    assert response.text
+
+
+def test_rate_limit(client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    from hibiapi.app import application
+
+    # NOTE: freeze the clock so both requests land in the same fresh window
+    window_start = 1600000020 // application.RATE_LIMIT_INTERVAL
+    now = window_start * application.RATE_LIMIT_INTERVAL + 10
+    monkeypatch.setattr(application, "time", lambda: now)
+    monkeypatch.setattr(application, "RATE_LIMIT_MAX", 1)
+
+    responses = [
+        client.get("/api/qrcode/", params={"text": "rate limit", "encode": "json"})
+        for _ in range(2)
+    ]
+    assert responses[0].status_code == 200
+
+    limited = responses[1]
+    assert limited.status_code == 429
+    retry_after = int(limited.headers["retry-after"])
+    assert retry_after == application.RATE_LIMIT_INTERVAL - 10
+    assert 0 < retry_after <= application.RATE_LIMIT_INTERVAL
+
+
+@pytest.mark.parametrize(
+    "path, status_code, location",
+    [
+        ("/qrcode/x", 301, "/api/qrcode/x"),
+        ("/pixiv/rank?mode=day", 301, "/api/pixiv/rank?mode=day"),
+        ("/netease/", 301, "/api/netease/"),
+        ("/bilibili/playurl", 301, "/api/bilibili/v2/playurl"),
+        ("/qrcodex/a", 404, None),
+    ],
+)
+def test_legacy_redirect(
+    client: TestClient, path: str, status_code: int, location: Optional[str]
+):
+    response = client.get(path, allow_redirects=False)
+    assert response.status_code == status_code
+    assert response.headers.get("location") == location
+
+
+@pytest.mark.parametrize(
+    "host, key",
+    [
+        ("1.2.3.4", "rate_limit:IPv4-01020304"),
+        ("::1", "rate_limit:IPv6-00000000000000000000000000000001"),
+        ("2001:db8::ff", "rate_limit:IPv6-20010db80000000000000000000000ff"),
+        ("testclient", "rate_limit:fallback-testclient"),
+    ],
+)
+def test_rate_limit_key(host: str, key: str):
+    from hibiapi.app.application import _limit_key_for
+
+    assert _limit_key_for(host) == key
+
+
+@pytest.mark.parametrize(
+    "username, password, accepted",
+    [
+        ("admin", "secret", True),
+        ("admin", "wrong", False),
+        ("admin", "", False),
+        ("nobody", "secret", False),
+        ("nobody", "", False),
+        ("duplicate", "first", True),
+        ("duplicate", "second", True),
+        ("duplicate", "third", False),
+        ("用户", "密码", True),
+        ("用户", "错误", False),
+    ],
+)
+def test_basic_authorization(
+    monkeypatch: pytest.MonkeyPatch, username: str, password: str, accepted: bool
+):
+    import asyncio
+    from hashlib import sha256
+
+    from fastapi.security import HTTPBasicCredentials
+
+    from hibiapi.app import application
+    from hibiapi.utils.exceptions import ClientSideException
+
+    allowed = [
+        application.AuthorizationModel(username=name, password=secret)
+        for name, secret in [
+            ("admin", "secret"),
+            ("duplicate", "first"),
+            ("duplicate", "second"),
+            ("用户", "密码"),
+        ]
+    ]
+    table = application._authorization_table(allowed)
+    assert all(
+        len(digest) == 32 for candidates in table.values() for digest in candidates
+    )
+    assert table[sha256("duplicate".encode()).digest()] == [
+        sha256(b"first").digest(),
+        sha256(b"second").digest(),
+    ]
+    monkeypatch.setattr(application, "AUTHORIZATION_TABLE", table)
+
+    credentials = HTTPBasicCredentials(username=username, password=password)
+    authorize = application.basic_authorization_depend(credentials)
+    if accepted:
+        assert asyncio.run(authorize) == (username, password)
+    else:
+        with pytest.raises(ClientSideException):
+            asyncio.run(authorize)
+
+
 @pytest.mark.xfail(reason="not implemented yet")
 def test_net_request():
     from hibiapi.utils.net import BaseNetClient
@@ -0,0 +1,50 @@
+import pytest
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (b'{"code": 0, "data": [1, 2]}', {"code": 0, "data": [1, 2]}),
+        (b"[1, 2]", [1, 2]),
+        (b'callback({"code": 0});', {"code": 0}),
+        (b'jQuery_1 (\n{"title": "(foo)"}\n)\n', {"title": "(foo)"}),
+        (b' \n{"a": "x (y)"}', {"a": "x (y)"}),
+        (b'\r\n\t["(", ")"]\n', ["(", ")"]),
+    ],
+)
+def test_parse_json(content: bytes, expected):
+    from hibiapi.api.bilibili.api.base import BaseBilibiliEndpoint
+
+    assert BaseBilibiliEndpoint._parse_json(content) == expected
+
+
+def test_parse_json_invalid():
+    from hibiapi.api.bilibili.api.base import BaseBilibiliEndpoint
+
+    with pytest.raises(ValueError):
+        BaseBilibiliEndpoint._parse_json(b"not a json")
+
+
+def test_sign(monkeypatch: pytest.MonkeyPatch):
+    from hashlib import md5
+
+    from hibiapi.api.bilibili.api import base
+    from hibiapi.api.bilibili.constants import BilibiliConstants
+
+    monkeypatch.setattr(base, "time", lambda: 1600000000.5)
+
+    url = base.BaseBilibiliEndpoint(None)._sign(  # type:ignore
+        "https://app.bilibili.com",
+        "x/v2/search",
+        {"keyword": "中文 (x)", "pn": None, "type": base.TimelineType.GLOBAL},
+    )
+    assert str(url) == (
+        "https://app.bilibili.com/x/v2/search"
+        "?access_key=5271b2f0eb92f5f89af4dc39197d8e41&appkey=1d8b6e7d45233436"
+        "&build=507000&device=android&keyword=%E4%B8%AD%E6%96%87+%28x%29"
+        "&mobi_app=android&platform=android&ts=1600000000&type=global"
+        "&sign=fc05179ebc812d6300908e59416bdfdf"
+    )
+
+    query, sign = url.query.rsplit(b"&sign=", 1)
+    assert sign.decode() == md5(query + BilibiliConstants.SECRET).hexdigest()